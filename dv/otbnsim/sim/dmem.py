@@ -166,14 +166,19 @@ class Dmem:
         '''Read a u256 little-endian value from an aligned address'''
         assert addr >= 0
         assert self.is_valid_256b_addr(addr)
-        ret_data = 0
-        for i in range(256 // 32):
-            rd_data = self.load_u32(addr + 4 * i)
-            if rd_data is None:
-                return None
-            ret_data = ret_data | (rd_data << (i * 32))
 
-        return ret_data
+        idx = addr // 4
+        words = self.data[idx:idx + 256 // 32]
+
+        # Handle "read under write" hazards properly
+        if self.pending:
+            for i in range(256 // 32):
+                words[i] = self.pending.get(idx + i, words[i])
+
+        if None in words:
+            return None
+
+        return int.from_bytes(struct.pack('<8I', *words), 'little')
 
     def store_u256(self, addr: int, value: int) -> None:
         '''Write a u256 little-endian value to an aligned address'''
@@ -232,10 +237,10 @@ class Dmem:
         '''Apply a trace entry to self.pending'''
         if item.is_wide:
             assert 0 <= item.value < (1 << 256)
-            mask = (1 << 32) - 1
-            for i in range(256 // 32):
-                wr_data = (item.value >> (i * 32)) & mask
-                self.pending[(item.addr // 4) + i] = wr_data
+            idx = item.addr // 4
+            words = struct.unpack('<8I', item.value.to_bytes(32, 'little'))
+            for i, wr_data in enumerate(words):
+                self.pending[idx + i] = wr_data
 
         else:
             assert 0 <= item.value <= (1 << 32) - 1
@@ -11,6 +11,8 @@ from .reg import Reg, RegFile
 class CallStackReg(Reg):
     '''A register used to represent x1'''
 
+    __slots__ = ('stack', 'saw_read', 'gpr_parent')
+
     # The depth of the x1 call stack
     stack_depth = 8
 
@@ -69,6 +69,18 @@ def _get_loop_warps(symbols: Dict[str, int]) -> LoopWarps:
     return ret
 
 
+def _dump_bin_words(path: str, data: bytes) -> None:
+    '''Write data to path as little-endian 32-bit words, one per line
+
+    Each word is written MSB first as a string of 32 binary digits (the format
+    expected by the memory initialisation in the SystemVerilog testbench).
+
+    '''
+    with open(path, 'w') as f:
+        f.writelines('{:032b}\n'.format(w32s[0])
+                     for w32s in struct.iter_unpack('<I', data))
+
+
 def load_elf(sim: OTBNSim, path: str) -> Optional[int]:
     '''Load ELF file at path and inject its contents into sim
 
@@ -76,17 +88,9 @@ def load_elf(sim: OTBNSim, path: str) -> Optional[int]:
 
     '''
     (imem_bytes, dmem_bytes, symbols) = read_elf(path)
-    
-    with open('dv/sv/mem/imem.txt', 'w') as f:
-        for i in range(0, len(imem_bytes),4):
-            f.write("{:08b}".format(imem_bytes[i+3]) + "{:08b}".format(imem_bytes[i+2]) + "{:08b}".format(imem_bytes[i+1]) + "{:08b}".format(imem_bytes[i])  )
-            f.write("\n")
-
-    with open('dv/sv/mem/dmem.txt', 'w') as f:
-        for i in range(0, len(dmem_bytes),4):
-            f.write("{:08b}".format(dmem_bytes[i+3]) + "{:08b}".format(dmem_bytes[i+2]) + "{:08b}".format(dmem_bytes[i+1]) + "{:08b}".format(dmem_bytes[i])  )
-            f.write("\n")
-            
+
+    _dump_bin_words('dv/sv/mem/imem.txt', imem_bytes)
+    _dump_bin_words('dv/sv/mem/dmem.txt', dmem_bytes)
 
     # Collect imem bytes into 32-bit words and set the validity bit for each
     assert len(imem_bytes) & 3 == 0
@@ -2,7 +2,7 @@
 # Licensed under the Apache License, Version 2.0, see LICENSE for details.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import List, Optional, Set
+from typing import Iterator, List, Optional
 
 from .trace import Trace
 
@@ -26,6 +26,10 @@ class TraceRegister(Trace):
 
 
 class Reg:
+    # Registers are accessed on almost every simulated instruction, so avoid a
+    # per-instance __dict__.
+    __slots__ = ('_parent', '_idx', '_width', '_uval', '_next_uval')
+
     def __init__(self,
                  parent: Optional['RegFile'],
                  idx: int,
@@ -96,41 +100,62 @@ class RegFile:
         assert 0 <= width
         assert 0 <= depth
 
-        self._name_pfx = name_pfx
         self._width = width
         self._registers = [Reg(self, i, width, 0) for i in range(depth)]
-        self._pending_writes = set()  # type: Set[int]
+        self._reg_names = ['{}{:02}'.format(name_pfx, i)
+                           for i in range(depth)]
+        # A bitmask of the registers that have been written this cycle (bit i
+        # is set if there is a pending write to register i).
+        self._pending_writes = 0
 
     def mark_written(self, idx: int) -> None:
         '''Mark a register as having been written'''
         assert 0 <= idx < len(self._registers)
-        self._pending_writes.add(idx)
+        self._pending_writes |= 1 << idx
+
+    def _pending_idxs(self) -> Iterator[int]:
+        '''Yield the indices of registers with pending writes, in order'''
+        bits = self._pending_writes
+        while bits:
+            lsb = bits & -bits
+            yield lsb.bit_length() - 1
+            bits ^= lsb
 
     def get_reg(self, idx: int) -> Reg:
         assert 0 <= idx < len(self._registers)
         return self._registers[idx]
 
     def changes(self) -> List[TraceRegister]:
+        if not self._pending_writes:
+            return []
+
         ret = []
-        for idx in sorted(self._pending_writes):
-            assert 0 <= idx < len(self._registers)
+        for idx in self._pending_idxs():
             next_val = self.get_reg(idx).read_next()
-            ret.append(TraceRegister('{}{:02}'.format(self._name_pfx, idx),
+            ret.append(TraceRegister(self._reg_names[idx],
                                      self._width,
                                      next_val))
         return ret
 
     def commit(self) -> None:
-        for idx in self._pending_writes:
-            assert 0 <= idx < len(self._registers)
-            self._registers[idx].commit()
-        self._pending_writes.clear()
+        # Most instructions don't write to a given register file, so skip the
+        # loop entirely in that case.
+        if not self._pending_writes:
+            return
+
+        regs = self._registers
+        for idx in self._pending_idxs():
+            regs[idx].commit()
+        self._pending_writes = 0
 
     def abort(self) -> None:
-        for idx in self._pending_writes:
-            assert 0 <= idx < len(self._registers)
-            self._registers[idx].abort()
-        self._pending_writes.clear()
+        if not self._pending_writes:
+            return
+
+        regs = self._registers
+        for idx in self._pending_idxs():
+            regs[idx].abort()
+        self._pending_writes = 0
 
     def peek_unsigned_values(self) -> List[int]:
         '''Get a list of the (unsigned) values of the registers'''
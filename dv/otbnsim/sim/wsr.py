@@ -357,16 +357,18 @@ class WSRFile:
         self.KeyS1L = KeyWSR('KeyS1L', 0, self.KeyS1)
         self.KeyS1H = KeyWSR('KeyS1H', 256, self.KeyS1)
 
-        self._by_idx = {
-            0: self.MOD,
-            1: self.RND,
-            2: self.URND,
-            3: self.ACC,
-            4: self.KeyS0L,
-            5: self.KeyS0H,
-            6: self.KeyS1L,
-            7: self.KeyS1H,
-        }
+        # The WSRs, in index order. The indices are dense, so we can look them
+        # up by position.
+        self._by_idx = (
+            self.MOD,
+            self.RND,
+            self.URND,
+            self.ACC,
+            self.KeyS0L,
+            self.KeyS0H,
+            self.KeyS1L,
+            self.KeyS1H,
+        )  # type: Tuple[WSR, ...]
 
     def on_start(self) -> None:
         '''Called at the start of an operation
@@ -374,12 +376,12 @@ class WSRFile:
         This clears values that don't persist between runs (everything except
         RND and the key registers)
         '''
-        for reg in self._by_idx.values():
+        for reg in self._by_idx:
             reg.on_start()
 
     def check_idx(self, idx: int) -> bool:
         '''Return True if idx is a valid WSR index'''
-        return idx in self._by_idx
+        return 0 <= idx < len(self._by_idx)
 
     def has_value_at_idx(self, idx: int) -> int:
         '''Return True if the WSR at idx has a valid valu.